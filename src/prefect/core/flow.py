@@ -862,48 +862,57 @@ class Flow:
         cached, so this private method is called and cached instead.
         """
 
+        # build adjacency from the flow's edges up front; looking up each task's
+        # neighbors through `upstream_tasks` / `downstream_tasks` would revalidate
+        # the flow's cache once per task
+        upstream = {
+            t: {e.upstream_task for e in edges}
+            for t, edges in self.all_upstream_edges().items()
+        }
+        downstream = {
+            t: {e.downstream_task for e in edges}
+            for t, edges in self.all_downstream_edges().items()
+        }
+
         # begin by getting all tasks under consideration (root tasks and all
         # downstream tasks)
         if root_tasks:
+            for t in root_tasks:
+                if t not in self.tasks:
+                    raise ValueError(
+                        "Task {t} was not found in Flow {f}".format(t=t, f=self)
+                    )
             tasks = set(root_tasks)
-            seen = set()  # type: Set[Task]
-
-            # while the set of tasks is different from the seen tasks...
-            while tasks.difference(seen):
-                # iterate over the new tasks...
-                for t in list(tasks.difference(seen)):
-                    # add its downstream tasks to the task list
-                    tasks.update(self.downstream_tasks(t))
-                    # mark it as seen
-                    seen.add(t)
+            to_visit = list(tasks)
+
+            # walk downstream from the root tasks, collecting every task reached
+            while to_visit:
+                for t in downstream[to_visit.pop()]:
+                    if t not in tasks:
+                        tasks.add(t)
+                        to_visit.append(t)
         else:
             tasks = self.tasks
 
-        # build the list of sorted tasks
-        remaining_tasks = list(tasks)
-        sorted_tasks = []
-        while remaining_tasks:
-            # mark the flow as cyclic unless we prove otherwise
-            cyclic = True
-
-            # iterate over each remaining task
-            for task in remaining_tasks.copy():
-                # check all the upstream tasks of that task
-                for upstream_task in self.upstream_tasks(task):
-                    # if the upstream task is also remaining, it means it
-                    # hasn't been sorted, so we can't sort this task either
-                    if upstream_task in remaining_tasks:
-                        break
-                else:
-                    # but if all upstream tasks have been sorted, we can sort
-                    # this one too. We note that we found no cycle this time.
-                    cyclic = False
-                    remaining_tasks.remove(task)
-                    sorted_tasks.append(task)
+        # count the upstream dependencies of each task that are also under
+        # consideration; tasks with none are ready to be sorted
+        in_degree = {t: sum(1 for u in upstream[t] if u in tasks) for t in tasks}
+        ready = collections.deque(t for t in tasks if in_degree[t] == 0)
 
-            # if we were unable to match any upstream tasks, we have a cycle
-            if cyclic:
-                raise ValueError("Cycle found; flows must be acyclic!")
+        # build the list of sorted tasks (Kahn's algorithm): each time a task is
+        # sorted, its downstream tasks have one fewer unsorted dependency
+        sorted_tasks = []
+        while ready:
+            task = ready.popleft()
+            sorted_tasks.append(task)
+            for downstream_task in downstream[task]:
+                in_degree[downstream_task] -= 1
+                if in_degree[downstream_task] == 0:
+                    ready.append(downstream_task)
+
+        # any task that was never ready must be part of a cycle
+        if len(sorted_tasks) < len(tasks):
+            raise ValueError("Cycle found; flows must be acyclic!")
 
         return tuple(sorted_tasks)
 
@@ -1021,6 +1030,11 @@ class Flow:
             "flow_run_name", kwargs.pop("flow_run_name", str(uuid.uuid4()))
         )
 
+        # a single runner, along with any user-provided task contexts, is reused
+        # for every retry of every scheduled run below
+        runner = runner_cls(flow=self)
+        task_contexts = kwargs.pop("task_contexts", {})
+
         # run this flow indefinitely, so long as its schedule has future dates
         while True:
 
@@ -1047,8 +1061,7 @@ class Flow:
 
             # begin a single flow run
             while not flow_state.is_finished():
-                runner = runner_cls(flow=self)
-                task_ctxts = kwargs.pop("task_contexts", {}).copy()
+                task_ctxts = task_contexts.copy()
                 for t in self.tasks:
                     task_ctxts.setdefault(t, dict())
                     task_ctxts[t].update(
@@ -1200,16 +1213,19 @@ class Flow:
         if runner_cls is None:
             runner_cls = prefect.engine.get_default_flow_runner_class()
 
+        # collect the flow's parameters once; each call to `parameters()` scans
+        # every task in the flow
+        flow_parameters = self.parameters()
+        flow_parameter_names = {p.name for p in flow_parameters}
+
         # build parameters from passed dictionary and also kwargs
         parameters = parameters or {}
-        for p in self.parameters():
+        for p in flow_parameters:
             if p.name in kwargs:
                 parameters[p.name] = kwargs.pop(p.name)
 
         # check for parameters that don't match the flow
-        unknown_params = [
-            p for p in parameters if p not in {fp.name for fp in self.parameters()}
-        ]
+        unknown_params = [p for p in parameters if p not in flow_parameter_names]
         if unknown_params:
             fmt_params = ", ".join(unknown_params)
             raise ValueError(
@@ -1220,7 +1236,7 @@ class Flow:
 
         # check for parameters that are required by the flow, but weren't passed
         missing_params = [
-            p.name for p in self.parameters() if p.required and p.name not in parameters
+            p.name for p in flow_parameters if p.required and p.name not in parameters
         ]
         if missing_params:
             fmt_params = ", ".join(missing_params)
@@ -439,9 +439,10 @@ class Task(metaclass=TaskMetaclass):
     def __repr__(self) -> str:
         return "<Task: {self.name}>".format(self=self)
 
-    # reimplement __hash__ because we override __eq__
-    def __hash__(self) -> int:
-        return id(self)
+    # tasks are compared and hashed by identity; the builtin implementations avoid a
+    # Python-level call on every dictionary lookup keyed by task
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
     # Run  --------------------------------------------------------------------
 
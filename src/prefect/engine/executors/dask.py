@@ -460,6 +460,11 @@ class LocalDaskExecutor(Executor):
     An executor that runs all functions locally using `dask` and a configurable
     dask scheduler.
 
+    The `"threads"` and `"processes"` schedulers start a pool of workers once per flow
+    run and reuse it for every task. Tasks that hold the GIL while doing CPU-bound work
+    only run in parallel with `"processes"`; in that case tasks and their results must
+    be picklable.
+
     Args:
         - scheduler (str): The local dask scheduler to use; common options are
             "threads", "processes", and "synchronous".  Defaults to "threads".
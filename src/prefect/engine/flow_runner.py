@@ -211,7 +211,10 @@ class FlowRunner(Runner):
                 handlers that will be provided to the task_runner, and called whenever a task
                 changes state.
             - executor (Executor, optional): executor to use when performing
-                computation; defaults to the executor specified in your prefect configuration
+                computation; defaults to the executor specified in your prefect configuration.
+                Every task is submitted as soon as it is reached in the flow's sorted order,
+                so tasks without a dependency between them run concurrently on a parallel
+                executor such as `LocalDaskExecutor` or `DaskExecutor`
             - context (Dict[str, Any], optional): prefect.Context to use for execution
                 to use for each Task run
             - task_contexts (Dict[Task, Dict[str, Any]], optional): contexts that will be
@@ -401,9 +404,9 @@ class FlowRunner(Runner):
             self.logger.info("Flow is not in a Running state.")
             raise ENDRUN(state)
 
-        if return_tasks is None:
-            return_tasks = set()
-        if set(return_tasks).difference(self.flow.tasks):
+        # convert to a set once; it is reused for validation and result collection
+        return_tasks = set(return_tasks or [])
+        if not return_tasks.issubset(self.flow.tasks):
             raise ValueError("Some tasks in return_tasks were not found in the flow.")
 
         def extra_context(task: Task, task_index: int = None) -> dict:
@@ -413,11 +416,23 @@ class FlowRunner(Runner):
                 "task_index": task_index,
             }
 
+        # -- analyze the flow's graph once, up front; every call into the flow's
+        # cache revalidates it against all tasks and edges, so these are kept out
+        # of the per-task loop below
+        sorted_tasks = self.flow.sorted_tasks()
+        upstream_edges = self.flow.all_upstream_edges()
+
+        # terminal tasks determine if the flow is finished
+        terminal_tasks = self.flow.terminal_tasks()
+
+        # reference tasks determine flow state
+        reference_tasks = self.flow.reference_tasks()
+
         # -- process each task in order
 
         with self.check_for_cancellation(), executor.start():
 
-            for task in self.flow.sorted_tasks():
+            for task in sorted_tasks:
                 task_state = task_states.get(task)
 
                 # if a task is a constant task, we already know its return value
@@ -467,25 +482,27 @@ class FlowRunner(Runner):
                 upstream_mapped_states = {}  # type: Dict[Edge, list]
 
                 # -- process each edge to the task
-                for edge in self.flow.edges_to(task):
+                # (edges hash all of their attributes, so each upstream state is
+                # worked on locally and stored in `upstream_states` just once)
+                for edge in upstream_edges[task]:
 
-                    # load the upstream task states (supplying Pending as a default)
-                    upstream_states[edge] = task_states.get(
-                        edge.upstream_task, Pending(message="Task state not available.")
-                    )
+                    # load the upstream task state (supplying Pending as a default)
+                    upstream_state = task_states.get(edge.upstream_task)
+                    if upstream_state is None:
+                        upstream_state = Pending(message="Task state not available.")
 
                     # if the edge is flattened and not the result of a map, then we
                     # preprocess the upstream states. If it IS the result of a
                     # map, it will be handled in `prepare_upstream_states_for_mapping`
                     if edge.flattened:
-                        if not isinstance(upstream_states[edge], Mapped):
-                            upstream_states[edge] = executor.submit(
-                                executors.flatten_upstream_state, upstream_states[edge]
+                        if not isinstance(upstream_state, Mapped):
+                            upstream_state = executor.submit(
+                                executors.flatten_upstream_state, upstream_state
                             )
 
                     # this checks whether the task is a "reduce" task for a mapped pipeline
                     # and if so, collects the appropriate upstream children
-                    if not edge.mapped and isinstance(upstream_states[edge], Mapped):
+                    if not edge.mapped and isinstance(upstream_state, Mapped):
                         children = mapped_children.get(edge.upstream_task, [])
 
                         # if the edge is flattened, then we need to wait for the mapped children
@@ -497,6 +514,8 @@ class FlowRunner(Runner):
 
                         upstream_mapped_states[edge] = children
 
+                    upstream_states[edge] = upstream_state
+
                 # augment edges with upstream constants
                 for key, val in self.flow.constants[task].items():
                     edge = Edge(
@@ -551,21 +570,22 @@ class FlowRunner(Runner):
 
                     submitted_states = []
 
+                    # if we are on a future rerun of a partially complete flow run,
+                    # there might be mapped children in a retrying state; the current
+                    # task state's map_states holds such info
+                    prior_map_states = (
+                        task_state.map_states
+                        if isinstance(task_state, Mapped)
+                        else None
+                    )
+
                     for idx, states in enumerate(list_of_upstream_states):
-                        # if we are on a future rerun of a partially complete flow run,
-                        # there might be mapped children in a retrying state; this check
-                        # looks into the current task state's map_states for such info
-                        if (
-                            isinstance(task_state, Mapped)
-                            and len(task_state.map_states) >= idx + 1
-                        ):
-                            current_state = task_state.map_states[
-                                idx
-                            ]  # type: Optional[State]
-                        elif isinstance(task_state, Mapped):
-                            current_state = None
+                        if prior_map_states is None:
+                            current_state = task_state  # type: Optional[State]
+                        elif idx < len(prior_map_states):
+                            current_state = prior_map_states[idx]
                         else:
-                            current_state = task_state
+                            current_state = None
 
                         # this is where each child is submitted for actual work
                         submitted_states.append(
@@ -607,17 +627,13 @@ class FlowRunner(Runner):
             # Collect results
             # ---------------------------------------------
 
-            # terminal tasks determine if the flow is finished
-            terminal_tasks = self.flow.terminal_tasks()
-
-            # reference tasks determine flow state
-            reference_tasks = self.flow.reference_tasks()
-
             # wait until all terminal tasks are finished
-            final_tasks = terminal_tasks.union(reference_tasks).union(return_tasks)
+            final_tasks = terminal_tasks.union(reference_tasks, return_tasks)
             final_states = executor.wait(
                 {
-                    t: task_states.get(t, Pending("Task not evaluated by FlowRunner."))
+                    t: task_states[t]
+                    if t in task_states
+                    else Pending("Task not evaluated by FlowRunner.")
                     for t in final_tasks
                 }
             )
@@ -625,7 +641,7 @@ class FlowRunner(Runner):
             # also wait for any children of Mapped tasks to finish, and add them
             # to the dictionary to determine flow state
             all_final_states = final_states.copy()
-            for t, s in list(final_states.items()):
+            for t, s in final_states.items():
                 if s.is_mapped():
                     # ensure we wait for any mapped children to complete
                     if t in mapped_children:
@@ -4,11 +4,15 @@ running. Signals are used in TaskRunners and FlowRunners as a way of communicati
 in states.
 """
 
-from typing import Type
+from typing import Any, Dict, Type
 
 from prefect.engine import state
 from prefect.utilities.exceptions import PrefectError
 
+# maps state class names to the signal that produces them; populated as each
+# PrefectStateSignal subclass that declares its own `_state_cls` is defined
+_SIGNALS_BY_STATE = dict()  # type: Dict[str, Type[PrefectStateSignal]]
+
 
 def signal_from_state(state: state.State) -> Type["PrefectStateSignal"]:
     """
@@ -24,14 +28,8 @@ def signal_from_state(state: state.State) -> Type["PrefectStateSignal"]:
     Raises:
         - ValueError: if no signal matches the provided state
     """
-    unprocessed = set(PrefectStateSignal.__subclasses__())
-    signals = dict()
-    while unprocessed:
-        sig = unprocessed.pop()
-        signals[sig._state_cls.__name__] = sig
-        unprocessed = unprocessed.union(sig.__subclasses__())
     try:
-        return signals[type(state).__name__]
+        return _SIGNALS_BY_STATE[type(state).__name__]
     except KeyError:
         raise ValueError(f"No signal matches the provided state: {state}") from None
 
@@ -64,6 +62,12 @@ class PrefectStateSignal(PrefectError):
 
     _state_cls = state.State  # type: type
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # subclasses that inherit their parent's state don't replace the parent
+        if "_state_cls" in cls.__dict__:
+            _SIGNALS_BY_STATE[cls._state_cls.__name__] = cls
+
     def __init__(self, message: str = None, *args, **kwargs):  # type: ignore
         super().__init__(message)  # type: ignore
         kwargs.setdefault("result", self)
@@ -11,13 +11,28 @@ Every run is initialized with the `Pending` state, meaning that it is waiting fo
 execution. During execution a run will enter a `Running` state. Finally, runs become `Finished`.
 """
 import datetime
-from typing import Any, Dict, List, Optional, Type, Mapping
+from typing import Any, Dict, List, Optional, Tuple, Type, Mapping
 
 import pendulum
 
 import prefect
 from prefect.engine.result import NoResult, Result, ResultInterface
 
+_MISSING = object()
+
+
+def _collect_compared_slots(cls: type) -> Tuple[str, ...]:
+    """
+    Collects the names of the public `__slots__` declared across a state class's MRO,
+    which are the attributes that state equality compares besides the result.
+    """
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in klass.__dict__.get("__slots__", ())
+        if not name.startswith("_") and name not in ["context", "message", "result"]
+    )
+
 
 class State:
     """
@@ -44,6 +59,9 @@ class State:
     """
 
     color = "#696969"
+    __slots__ = ("message", "_result", "context", "cached_inputs")
+    # the slotted attributes compared by `__eq__`; set for each class on creation
+    _compared_slots = ()  # type: Tuple[str, ...]
 
     def __init__(
         self,
@@ -65,14 +83,23 @@ class State:
         else:
             return f"<{type(self).__name__}>"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compared_slots = _collect_compared_slots(cls)
+
     def __eq__(self, other: object) -> bool:
         """
         Equality depends on state type and data, but not message or context
         """
+        if self is other:
+            return True
         if type(self) == type(other):
             assert isinstance(other, State)  # this assertion is here for MyPy only
             eq = self.result == other.result  # type: ignore
-            for attr in self.__dict__:
+            for attr in self._compared_slots:
+                eq &= getattr(self, attr, _MISSING) == getattr(other, attr, _MISSING)
+            # subclasses that don't declare `__slots__` keep extra attributes here
+            for attr in getattr(self, "__dict__", ()):
                 if attr.startswith("_") or attr in ["context", "message", "result"]:
                     continue
                 eq &= getattr(self, attr, object()) == getattr(other, attr, object())
@@ -107,9 +134,10 @@ class State:
             - State: the current state with a fully hydrated Result attached
         """
         if self.is_mapped():
+            assert isinstance(self, Mapped)  # mypy assert
             self.map_states = [
                 s.load_result(result) if s is not None else None
-                for s in self.map_states  # type: ignore
+                for s in self.map_states
             ]
             if self.map_states:
                 self.result = [
@@ -374,6 +402,10 @@ class State:
         return json_blob
 
 
+# `__init_subclass__` only runs for subclasses, so derive the base class's value here
+State._compared_slots = _collect_compared_slots(State)
+
+
 # -------------------------------------------------------------------
 # Pending States
 # -------------------------------------------------------------------
@@ -394,6 +426,7 @@ class Pending(State):
     """
 
     color = "#7ebdff"
+    __slots__ = ()
 
     def __init__(
         self,
@@ -427,6 +460,7 @@ class Scheduled(Pending):
     """
 
     color = "#ffab00"
+    __slots__ = ("start_time",)
     start_time: Optional[datetime.datetime]
 
     def __init__(
@@ -464,6 +498,7 @@ class Paused(Scheduled):
     """
 
     color = "#99a8e8"
+    __slots__ = ()
 
     def __init__(
         self,
@@ -498,6 +533,8 @@ class _MetaState(State):
     easily identified.
     """
 
+    __slots__ = ("_state",)
+
     def __init__(
         self,
         message: str = None,
@@ -544,6 +581,7 @@ class ClientFailed(_MetaState):
     """
 
     color = "#eb0000"
+    __slots__ = ()
 
 
 class Submitted(_MetaState):
@@ -569,6 +607,7 @@ class Submitted(_MetaState):
     """
 
     color = "#ffdf5d"
+    __slots__ = ()
 
 
 class Queued(_MetaState):
@@ -593,6 +632,7 @@ class Queued(_MetaState):
     """
 
     color = "#ffea7f"
+    __slots__ = ("start_time",)
 
     def __init__(
         self,
@@ -629,6 +669,7 @@ class Resume(Scheduled):
     """
 
     color = "#f58c0c"
+    __slots__ = ()
 
 
 class Retrying(Scheduled):
@@ -650,6 +691,7 @@ class Retrying(Scheduled):
     """
 
     color = "#f66a0a"
+    __slots__ = ("run_count",)
 
     def __init__(
         self,
@@ -693,6 +735,7 @@ class Running(State):
     """
 
     color = "#3d67ff"
+    __slots__ = ()
 
 
 class Cancelling(Running):
@@ -711,6 +754,7 @@ class Cancelling(Running):
     """
 
     color = "#E8E8E8"
+    __slots__ = ()
 
 
 # -------------------------------------------------------------------
@@ -733,6 +777,7 @@ class Finished(State):
     """
 
     color = "#003ccb"
+    __slots__ = ()
 
 
 class Looped(Finished):
@@ -754,6 +799,7 @@ class Looped(Finished):
     """
 
     color = "#003ccb"
+    __slots__ = ("loop_count",)
 
     def __init__(
         self,
@@ -787,6 +833,7 @@ class Success(Finished):
     """
 
     color = "#28a745"
+    __slots__ = ()
 
 
 class Cached(Success):
@@ -809,6 +856,7 @@ class Cached(Success):
     """
 
     color = "#34d058"
+    __slots__ = ("hashed_inputs", "cached_parameters", "cached_result_expiration")
 
     def __init__(
         self,
@@ -857,6 +905,7 @@ class Mapped(Success):
     """
 
     color = "#003ccb"
+    __slots__ = ("map_states", "_n_map_states")
 
     def __init__(
         self,
@@ -897,6 +946,7 @@ class Cancelled(Finished):
     """
 
     color = "#bdbdbd"
+    __slots__ = ()
 
 
 class Failed(Finished):
@@ -914,6 +964,7 @@ class Failed(Finished):
     """
 
     color = "#eb0000"
+    __slots__ = ()
 
     def __init__(
         self,
@@ -942,6 +993,7 @@ class TimedOut(Failed):
     """
 
     color = "#ff4e33"
+    __slots__ = ()
 
 
 class TriggerFailed(Failed):
@@ -959,6 +1011,7 @@ class TriggerFailed(Failed):
     """
 
     color = "#ff5131"
+    __slots__ = ()
 
 
 class ValidationFailed(Failed):
@@ -976,6 +1029,7 @@ class ValidationFailed(Failed):
     """
 
     color = "#ff5131"
+    __slots__ = ()
 
 
 class Skipped(Success):
@@ -993,6 +1047,7 @@ class Skipped(Success):
     """
 
     color = "#62757f"
+    __slots__ = ()
 
     # note: this does not allow setting "cached" as Success states do
     def __init__(
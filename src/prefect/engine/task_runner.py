@@ -746,12 +746,18 @@ class TaskRunner(Runner):
         Raises:
             - ENDRUN: if the task is not ready to run
         """
+        # most tasks have no cache to check
+        if not state.is_cached() and self.task.cache_for is None:
+            return state
+
+        # unwrap the input values and look up the parameters once for every
+        # cache validation below
+        sanitized_inputs = {key: res.value for key, res in inputs.items()}
+        parameters = prefect.context.get("parameters")
+
         if state.is_cached():
             assert isinstance(state, Cached)  # mypy assert
-            sanitized_inputs = {key: res.value for key, res in inputs.items()}
-            if self.task.cache_validator(
-                state, sanitized_inputs, prefect.context.get("parameters")
-            ):
+            if self.task.cache_validator(state, sanitized_inputs, parameters):
                 return state
             else:
                 state = Pending("Cache was invalid; ready to run.")
@@ -762,11 +768,8 @@ class TaskRunner(Runner):
                 candidate_states = prefect.context.caches.get(
                     self.task.cache_key or self.task.name, []
                 )
-            sanitized_inputs = {key: res.value for key, res in inputs.items()}
             for candidate in candidate_states:
-                if self.task.cache_validator(
-                    candidate, sanitized_inputs, prefect.context.get("parameters")
-                ):
+                if self.task.cache_validator(candidate, sanitized_inputs, parameters):
                     return candidate
 
         if self.task.cache_for is not None:
@@ -1,10 +1,12 @@
 import warnings
-from typing import Callable, List
-
-from distributed.security import Security
+from typing import Callable, List, TYPE_CHECKING
 
 from prefect.environments.execution.remote import RemoteEnvironment
 
+if TYPE_CHECKING:
+    # import distributed only for type checking to reduce prefect import times
+    from distributed.security import Security
+
 
 class RemoteDaskEnvironment(RemoteEnvironment):
     """
@@ -54,7 +56,7 @@ class RemoteDaskEnvironment(RemoteEnvironment):
     def __init__(
         self,
         address: str,
-        security: Security = None,
+        security: "Security" = None,
         executor_kwargs: dict = None,
         labels: List[str] = None,
         on_start: Callable = None,
@@ -206,10 +206,9 @@ def some_failed(
             return True
 
         # scale conversions
-        num_failed = len(
-            [s for s in _get_all_states_as_set(upstream_states) if s.is_failed()]
-        )
-        num_states = len(_get_all_states_as_set(upstream_states))
+        all_states = _get_all_states_as_set(upstream_states)
+        num_failed = len([s for s in all_states if s.is_failed()])
+        num_states = len(all_states)
         if at_least is not None:
             min_num = (num_states * at_least) if at_least < 1 else at_least
         else:
@@ -265,10 +264,9 @@ def some_successful(
             return True
 
         # scale conversions
-        num_success = len(
-            [s for s in _get_all_states_as_set(upstream_states) if s.is_successful()]
-        )
-        num_states = len(_get_all_states_as_set(upstream_states))
+        all_states = _get_all_states_as_set(upstream_states)
+        num_success = len([s for s in all_states if s.is_successful()])
+        num_states = len(all_states)
         if at_least is not None:
             min_num = (num_states * at_least) if at_least < 1 else at_least
         else:
@@ -295,11 +293,10 @@ def not_all_skipped(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
 
-    if all(state.is_skipped() for state in _get_all_states_as_set(upstream_states)):
+    all_states = _get_all_states_as_set(upstream_states)
+    if all(state.is_skipped() for state in all_states):
         raise signals.SKIP("All upstreams were skipped", result=None)
-    elif not all(
-        state.is_successful() for state in _get_all_states_as_set(upstream_states)
-    ):
+    elif not all(state.is_successful() for state in all_states):
         raise signals.TRIGGERFAIL(
             'Trigger was "not_all_skipped" but some of the upstream tasks failed.'
         )
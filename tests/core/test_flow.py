@@ -1093,6 +1093,57 @@ def test_sorted_tasks_with_start_task():
     assert set(f.sorted_tasks(root_tasks=[t3])) == set([t3, t4, t5])
 
 
+def test_sorted_tasks_with_diamond_and_start_task():
+    """
+    t1 -> t2 -> t4
+    t1 -> t3 -> t4
+          t5 -> t3
+    """
+    f = Flow(name="test")
+    t1 = Task("1")
+    t2 = Task("2")
+    t3 = Task("3")
+    t4 = Task("4")
+    t5 = Task("5")
+    f.add_edge(t1, t2)
+    f.add_edge(t1, t3)
+    f.add_edge(t2, t4)
+    f.add_edge(t3, t4)
+    f.add_edge(t5, t3)
+
+    tasks = f.sorted_tasks()
+    assert set(tasks) == set([t1, t2, t3, t4, t5])
+    for edge in f.edges:
+        assert tasks.index(edge.upstream_task) < tasks.index(edge.downstream_task)
+
+    # upstream tasks outside of the start tasks' descendants are ignored
+    tasks = f.sorted_tasks(root_tasks=[t3])
+    assert tasks == (t3, t4)
+
+
+def test_sorted_tasks_raises_for_cycle_downstream_of_root_task():
+    f = Flow(name="test")
+    t1 = Task()
+    t2 = Task()
+    t3 = Task()
+    f.add_edge(t1, t2)
+    f.add_edge(t2, t3)
+    f.add_edge(t3, t2, validate=False)
+    with pytest.raises(ValueError, match="Cycle found"):
+        f.sorted_tasks()
+
+
+def test_sorted_tasks_reads_flow_edges_once(monkeypatch):
+    f = Flow(name="test")
+    tasks = [Task(str(i)) for i in range(10)]
+    f.chain(*tasks)
+
+    upstream_edges = MagicMock(wraps=f.all_upstream_edges)
+    monkeypatch.setattr(f, "all_upstream_edges", upstream_edges)
+    assert f.sorted_tasks() == tuple(tasks)
+    assert upstream_edges.call_count == 1
+
+
 def test_sorted_tasks_with_invalid_start_task():
     """
     t1 -> t2 -> t3 -> t4
@@ -1735,7 +1786,8 @@ class TestGetTasks:
     def test_get_tasks_defaults_to_return_everything(self):
         t1, t2 = Task(name="t1"), Task(name="t2")
         f = Flow(name="test", tasks=[t1, t2])
-        assert f.get_tasks() == [t1, t2]
+        # flow.tasks is a set, so tasks are returned in no particular order
+        assert sorted(f.get_tasks(), key=lambda t: t.name) == [t1, t2]
 
     def test_get_tasks_defaults_to_name(self):
         t1, t2 = Task(name="t1"), Task(name="t2")
@@ -1745,7 +1797,7 @@ class TestGetTasks:
     def test_get_tasks_takes_intersection(self):
         t1, t2 = Task(name="t1", slug="11"), Task(name="t1", slug="22")
         f = Flow(name="test", tasks=[t1, t2])
-        assert f.get_tasks(name="t1") == [t1, t2]
+        assert set(f.get_tasks(name="t1")) == {t1, t2}
         assert f.get_tasks(name="t1", slug="11") == [t1]
         assert f.get_tasks(name="t1", slug="11", tags=["atag"]) == []
 
@@ -2577,6 +2629,31 @@ class TestFlowRunMethod:
         state = f.run()
         assert state.result[report_start_time].result is start_time
 
+    def test_flow_dot_run_persists_task_contexts_across_retries(self):
+        @task(max_retries=1, retry_delay=datetime.timedelta(0))
+        def report_context():
+            if prefect.context.task_run_count == 1:
+                raise ValueError("I'm not ready to tell you yet")
+            return prefect.context.get("special")
+
+        f = Flow(name="test", tasks=[report_context])
+        state = f.run(task_contexts={report_context: dict(special=42)})
+        assert state.result[report_context].result == 42
+
+    def test_flow_dot_run_reuses_runner_across_retries(self):
+        @task(max_retries=2, retry_delay=datetime.timedelta(0))
+        def flaky():
+            if prefect.context.task_run_count < 3:
+                raise ValueError("Not yet")
+            return 1
+
+        runner_cls = MagicMock(wraps=prefect.engine.flow_runner.FlowRunner)
+        f = Flow(name="test", tasks=[flaky])
+        state = f.run(runner_cls=runner_cls)
+        assert state.is_successful()
+        assert state.result[flaky].result == 1
+        assert runner_cls.call_count == 1
+
     def test_flow_dot_run_updates_the_scheduled_start_time_of_each_scheduled_run(self):
 
         start_times = [pendulum.now().add(seconds=i * 0.2) for i in range(1, 4)]
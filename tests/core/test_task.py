@@ -394,6 +394,15 @@ class TestInputsOutputs:
             assert self.mult(x=1).outputs() == int
 
 
+def test_tasks_are_compared_and_hashed_by_identity():
+    t1 = Task(name="same")
+    t2 = Task(name="same")
+    assert t1 == t1
+    assert t1 != t2
+    assert hash(t1) == object.__hash__(t1)
+    assert {t1: 1, t2: 2}[t2] == 2
+
+
 class TestTaskCopy:
     def test_copy_copies(self):
         class CopyTask(Task):
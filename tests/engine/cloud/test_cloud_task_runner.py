@@ -1072,9 +1072,8 @@ def test_task_runner_handles_version_lock_error(monkeypatch):
         runner.call_runner_target_handlers(Pending(), Running())
 
     # result load error
-    s = Success()
-    s.load_result = MagicMock(side_effect=Exception())
-    client.get_task_run_state.return_value = s
+    monkeypatch.setattr(Success, "load_result", MagicMock(side_effect=Exception()))
+    client.get_task_run_state.return_value = Success()
     with pytest.raises(ENDRUN):
         res = runner.call_runner_target_handlers(Pending(), Running())
 
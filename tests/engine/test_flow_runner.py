@@ -95,6 +95,28 @@ class SlowTask(Task):
         time.sleep(secs)
 
 
+@pytest.fixture(scope="module")
+def independent_success_flow():
+    "A flow with two successful tasks and no dependencies between them"
+    return Flow(name="test", tasks=[SuccessTask(), SuccessTask()])
+
+
+@pytest.fixture(scope="module")
+def linear_success_flow():
+    "A flow with two successful tasks, the second downstream of the first"
+    flow = Flow(name="test")
+    flow.add_edge(SuccessTask(), SuccessTask())
+    return flow
+
+
+@pytest.fixture(scope="module")
+def linear_error_flow():
+    "A flow with a successful task upstream of a task that raises an error"
+    flow = Flow(name="test")
+    flow.add_edge(SuccessTask(), ErrorTask())
+    return flow
+
+
 def test_flow_runner_has_logger():
     r = FlowRunner(Flow(name="test"))
     assert r.logger.name == "prefect.FlowRunner"
@@ -129,13 +151,20 @@ def test_flow_runner_with_invalid_return_tasks():
     assert state.is_failed()
 
 
-def test_flow_runner_runs_basic_flow_with_2_independent_tasks():
+def test_flow_runner_with_return_tasks_from_another_flow():
     flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = SuccessTask()
+    flow.add_task(SuccessTask())
+    flow_runner = FlowRunner(flow=flow)
+    state = flow_runner.run(return_tasks=[SuccessTask()])
+    assert state.is_failed()
+    assert "not found in the flow" in state.message
 
-    flow.add_task(task1)
-    flow.add_task(task2)
+
+def test_flow_runner_runs_basic_flow_with_2_independent_tasks(
+    independent_success_flow,
+):
+    flow = independent_success_flow
+    task1, task2 = flow.sorted_tasks()
 
     flow_state = FlowRunner(flow=flow).run(return_tasks=[task1, task2])
     assert isinstance(flow_state, Success)
@@ -143,12 +172,26 @@ def test_flow_runner_runs_basic_flow_with_2_independent_tasks():
     assert flow_state.result[task2] == Success(result=1)
 
 
-def test_flow_runner_runs_basic_flow_with_2_dependent_tasks():
+def test_flow_runner_analyzes_flow_graph_once_per_run(monkeypatch):
     flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = SuccessTask()
+    tasks = [SuccessTask() for _ in range(5)]
+    flow.chain(*tasks)
+
+    # populate the flow's cache so only the runner's own lookups are counted
+    FlowRunner(flow=flow).run()
+
+    upstream_edges = MagicMock(wraps=flow.all_upstream_edges)
+    monkeypatch.setattr(flow, "all_upstream_edges", upstream_edges)
+
+    flow_state = FlowRunner(flow=flow).run(return_tasks=tasks)
+    assert isinstance(flow_state, Success)
+    assert all(flow_state.result[t] == Success(result=1) for t in tasks)
+    assert upstream_edges.call_count == 1
 
-    flow.add_edge(task1, task2)
+
+def test_flow_runner_runs_basic_flow_with_2_dependent_tasks(linear_success_flow):
+    flow = linear_success_flow
+    task1, task2 = flow.sorted_tasks()
 
     flow_state = FlowRunner(flow=flow).run(return_tasks=[task1, task2])
     assert isinstance(flow_state, Success)
@@ -209,12 +252,11 @@ def test_flow_runner_runs_basic_flow_with_2_dependent_tasks_and_first_task_fails
     assert isinstance(flow_state.result[task2], TriggerFailed)
 
 
-def test_flow_runner_runs_basic_flow_with_2_dependent_tasks_and_second_task_fails():
-    flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = ErrorTask()
-
-    flow.add_edge(task1, task2)
+def test_flow_runner_runs_basic_flow_with_2_dependent_tasks_and_second_task_fails(
+    linear_error_flow,
+):
+    flow = linear_error_flow
+    task1, task2 = flow.sorted_tasks()
 
     flow_state = FlowRunner(flow=flow).run(return_tasks=[task1, task2])
     assert isinstance(flow_state, Failed)
@@ -222,12 +264,11 @@ def test_flow_runner_runs_basic_flow_with_2_dependent_tasks_and_second_task_fail
     assert isinstance(flow_state.result[task2], Failed)
 
 
-def test_flow_runner_does_not_return_task_states_when_it_doesnt_run():
-    flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = ErrorTask()
-
-    flow.add_edge(task1, task2)
+def test_flow_runner_does_not_return_task_states_when_it_doesnt_run(
+    linear_error_flow,
+):
+    flow = linear_error_flow
+    task1, task2 = flow.sorted_tasks()
 
     flow_state = FlowRunner(flow=flow).run(
         state=Success(result=5), return_tasks=[task1, task2]
@@ -236,13 +277,12 @@ def test_flow_runner_does_not_return_task_states_when_it_doesnt_run():
     assert flow_state.result == 5
 
 
-def test_flow_run_method_returns_task_states_even_if_it_doesnt_run():
+def test_flow_run_method_returns_task_states_even_if_it_doesnt_run(
+    linear_error_flow,
+):
     # https://github.com/PrefectHQ/prefect/issues/19
-    flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = ErrorTask()
-
-    flow.add_edge(task1, task2)
+    flow = linear_error_flow
+    task1, task2 = flow.sorted_tasks()
 
     flow_state = flow.run(state=Success())
     assert flow_state.is_successful()
@@ -281,20 +321,15 @@ def test_secrets_dynamically_pull_from_context():
     assert flow_state.is_successful()
 
 
-def test_flow_runner_doesnt_return_by_default():
-    flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = SuccessTask()
-    flow.add_edge(task1, task2)
+def test_flow_runner_doesnt_return_by_default(linear_success_flow):
+    flow = linear_success_flow
     res = FlowRunner(flow=flow).run()
     assert res.result == {}
 
 
-def test_flow_runner_does_return_tasks_when_requested():
-    flow = Flow(name="test")
-    task1 = SuccessTask()
-    task2 = SuccessTask()
-    flow.add_edge(task1, task2)
+def test_flow_runner_does_return_tasks_when_requested(linear_success_flow):
+    flow = linear_success_flow
+    task1, task2 = flow.sorted_tasks()
     flow_state = FlowRunner(flow=flow).run(return_tasks=[task1])
     assert isinstance(flow_state, Success)
     assert isinstance(flow_state.result[task1], Success)
@@ -20,6 +20,7 @@ from prefect.engine.state import (
     Failed,
     Looped,
     Paused,
+    Pending,
     Retrying,
     Skipped,
     State,
@@ -135,3 +136,15 @@ def test_retry_signals_carry_default_retry_time_on_state():
 )
 def test_signal_from_state_returns_correct_signal(signal, state):
     assert signal_from_state(state("Dummy message")) == signal
+
+
+def test_signal_from_state_ignores_subclasses_that_inherit_their_state():
+    class MyFAIL(FAIL):
+        pass
+
+    assert signal_from_state(Failed("Dummy message")) is FAIL
+
+
+def test_signal_from_state_raises_for_unknown_state():
+    with pytest.raises(ValueError, match="No signal matches"):
+        signal_from_state(Pending())
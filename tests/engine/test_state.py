@@ -1,5 +1,6 @@
 import datetime
 import json
+from unittest.mock import MagicMock
 
 import pendulum
 import pytest
@@ -320,6 +321,13 @@ def test_state_equality():
     assert not Pending(cached_inputs=dict(x=1)) == Pending(cached_inputs=dict(y=1))
 
 
+def test_state_equality_short_circuits_on_identity():
+    result = MagicMock()
+    state = Success(result=result)
+    assert state == state
+    assert not result.__eq__.called
+
+
 def test_state_equality_ignores_context():
     s, r = State(result=1), State(result=1)
     s.context["key"] = "value"
@@ -339,6 +347,33 @@ def test_state_equality_with_nested_states():
     assert s1 == s3
 
 
+def test_state_equality_compares_subclass_attributes():
+    now = pendulum.now("utc")
+    assert Retrying(start_time=now, run_count=2) == Retrying(
+        start_time=now, run_count=2
+    )
+    assert Retrying(start_time=now, run_count=2) != Retrying(
+        start_time=now, run_count=3
+    )
+    assert Mapped(map_states=[Success()]) != Mapped(map_states=[Failed()])
+
+    class MyState(Success):
+        def __init__(self, extra=None, **kwargs):
+            super().__init__(**kwargs)
+            self.extra = extra
+
+    assert MyState(extra=1) == MyState(extra=1)
+    assert MyState(extra=1) != MyState(extra=2)
+
+
+@pytest.mark.parametrize("cls", all_states)
+def test_states_use_slots(cls):
+    state = cls()
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(AttributeError):
+        state.not_an_attribute = 1
+
+
 def test_states_are_hashable():
     assert {State(), Pending(), Success()}
 